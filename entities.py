@@ -1,6 +1,60 @@
 import random
+import pygame
 from settings import *
-from pgzero.builtins import Actor, keyboard, sounds
+from pgzero.builtins import Actor, sounds, images
+
+# Cache das máscaras de colisão (nome do frame -> Mask), preenchido no carregamento dos assets
+MASKS = {}
+
+# Cache das superfícies dos frames (nome do frame -> Surface), preenchido junto com as máscaras
+SURFACES = {}
+
+# Cache das superfícies usadas para desenhar as máscaras no modo debug
+MASK_OVERLAYS = {}
+
+def load_frames(frames):
+    """
+        Carrega, uma única vez, a superfície e a máscara de colisão (canal alfa) de cada frame.
+
+        Args:
+            frames (list): Lista com os nomes das imagens dos frames.
+    """
+    for frame in frames:
+        if frame not in MASKS:
+            SURFACES[frame] = images.load(frame)
+            MASKS[frame] = pygame.mask.from_surface(SURFACES[frame])
+
+def set_frame(actor, frame):
+    """
+        Troca a imagem de um Actor usando a superfície já carregada por load_frames().
+
+        Faz o mesmo que 'actor.image = frame', mas sem passar pelo loader de imagens
+        nem pelo __setattr__ do Actor (usado ao restaurar snapshots).
+
+        Args:
+            actor (Actor): O Actor que terá a imagem trocada.
+            frame (str): Nome da imagem do frame.
+    """
+    attrs = actor.__dict__
+    attrs['_image_name'] = frame
+    attrs['_orig_surf'] = attrs['_surf'] = SURFACES[frame]
+    actor._update_pos()
+
+def get_mask_overlay(frame):
+    """
+        Retorna a superfície colorida da máscara de um frame, para o modo debug.
+
+        Args:
+            frame (str): Nome da imagem do frame.
+
+        Returns:
+            Surface: A máscara pintada com DEBUG_MASK_COLOR e fundo transparente.
+    """
+    overlay = MASK_OVERLAYS.get(frame)
+    if overlay is None:
+        overlay = MASK_OVERLAYS[frame] = MASKS[frame].to_surface(setcolor=DEBUG_MASK_COLOR,
+                                                                 unsetcolor=(0, 0, 0, 0))
+    return overlay
 
 class Entity(Actor):
     def __init__(self, pos, idle_frames, right_walk_frames, left_walk_frames,
@@ -32,6 +86,28 @@ class Entity(Actor):
         self.left_attack_frames = left_attack_frames
         self.hit_frames = hit_frames
 
+        # Carrega as superfícies e as máscaras de colisão de todos os frames da entidade
+        for frames in (idle_frames, right_walk_frames, left_walk_frames, climb_frames,
+                       right_jump_frames, left_jump_frames, idle_jump_frames,
+                       right_attack_frames, left_attack_frames, hit_frames):
+            if frames:
+                load_frames(frames)
+
+        # Mapeamento de animações (montado uma única vez, não a cada frame)
+        self.animation_map = {
+            "IDLE": self.idle_frames,
+            "RIGHT_WALK": self.right_walk_frames,
+            "LEFT_WALK": self.left_walk_frames,
+            # Observe que no caso dos frames opcionais, foi usado o inserido ou
+            # caso seja None, o frame idle (obrigatório). Isso evita erros de NoneType
+            "RIGHT_JUMP": self.right_jump_frames or self.idle_frames,
+            "LEFT_JUMP": self.left_jump_frames or self.idle_frames,
+            "IDLE_JUMP": self.idle_jump_frames or self.idle_frames,
+            "DEATH": self.hit_frames or self.idle_frames,
+            "ATTACK_RIGHT": self.right_attack_frames or self.idle_frames,
+            "ATTACK_LEFT": self.left_attack_frames or self.idle_frames,
+        }
+
         # Define atributos importantes para as animações
         self.frame_index = 0
         self.anim_timer = 0
@@ -41,6 +117,74 @@ class Entity(Actor):
         self.is_dead = False
         self.is_attacking = False
 
+    def get_state(self):
+        """
+            Captura o estado lógico da entidade em uma tupla plana.
+
+            Returns:
+                tuple: Valores na ordem esperada por set_state().
+        """
+        rect = self._rect
+        return (rect.x, rect.y, self._image_name, self.frame_index, self.anim_timer,
+                self.state, self.hit_right, self.is_dead, self.is_attacking)
+
+    def set_state(self, state, i):
+        """
+            Restaura o estado lógico a partir de uma tupla plana.
+
+            Os atributos são escritos direto no __dict__: o __setattr__ do Actor
+            procura cada nome na lista de atributos do Rect, o que deixaria a
+            restauração muito mais lenta.
+
+            Args:
+                state (tuple): Snapshot plano do mundo.
+                i (int): Posição onde começam os valores desta entidade.
+
+            Returns:
+                int: Posição logo após os valores lidos.
+        """
+        # Só troca a imagem (e recalcula a âncora) se o frame mudou
+        if state[i + 2] != self._image_name:
+            set_frame(self, state[i + 2])
+
+        rect = self._rect
+        rect.x = state[i]
+        rect.y = state[i + 1]
+
+        attrs = self.__dict__
+        attrs['frame_index'] = state[i + 3]
+        attrs['anim_timer'] = state[i + 4]
+        attrs['state'] = state[i + 5]
+        attrs['hit_right'] = state[i + 6]
+        attrs['is_dead'] = state[i + 7]
+        attrs['is_attacking'] = state[i + 8]
+        return i + 9
+
+    @property
+    def mask(self):
+        """ Máscara de colisão do frame atual (já calculada no carregamento). """
+        return MASKS[self.image]
+
+    def collide_mask(self, other):
+        """
+            Verifica a colisão pixel a pixel com outra entidade.
+
+            O teste de retângulos é feito antes, como um filtro barato: as máscaras
+            só são comparadas quando os retângulos das imagens se encostam.
+
+            Args:
+                other (Entity): A entidade com a qual a colisão será verificada.
+
+            Returns:
+                bool: True se algum pixel visível das duas imagens se sobrepõe.
+        """
+        if not self.colliderect(other):
+            return False
+
+        # Posição da outra máscara em relação ao canto superior esquerdo desta
+        offset = (round(other.left - self.left), round(other.top - self.top))
+        return self.mask.overlap(other.mask, offset) is not None
+
     def update_animation(self, is_moving, on_ground, velocity_x, velocity_y):
         """
             Atualiza o estado lógico e a imagem visual da entidade.
@@ -94,29 +238,17 @@ class Entity(Actor):
             self.frame_index += 1   # Muda o frame
 
 
-        # Mapeamento de animações
-        animation_map = {
-            "IDLE": self.idle_frames,
-            "RIGHT_WALK": self.right_walk_frames,
-            "LEFT_WALK": self.left_walk_frames,
-            # Observe que no caso dos frames opcionais, foi usado o inserido ou
-            # caso seja None, o frame idle (obrigatório). Isso evita erros de NoneType
-            "RIGHT_JUMP": self.right_jump_frames or self.idle_frames,
-            "LEFT_JUMP": self.left_jump_frames or self.idle_frames,
-            "IDLE_JUMP": self.idle_jump_frames or self.idle_frames,
-            "DEATH": self.hit_frames or self.idle_frames,
-            "ATTACK_RIGHT": self.right_attack_frames or self.idle_frames,
-            "ATTACK_LEFT": self.left_attack_frames or self.idle_frames,
-        }
-
         # Usamos o .get para garantir que, para algum estado diferente dos mencionados
         # anteriormente (não presentes no dicionário), sejam substituídos pelo frame idle
-        frames = animation_map.get(self.state, self.idle_frames)
+        frames = self.animation_map.get(self.state, self.idle_frames)
 
         # Agora vamos aplicar as animações (passar os frames)
         if frames:
-            # Quando passar todos os frames da lista, volta para o início
-            self.image = frames[self.frame_index % len(frames)]
+            # Quando passar todos os frames da lista, volta para o início (a superfície só
+            # é trocada quando o frame muda, e sem passar pelo loader de imagens)
+            frame = frames[self.frame_index % len(frames)]
+            if frame != self._image_name:
+                set_frame(self, frame)
 
 class Kitten(Entity):
     def __init__(self, pos):
@@ -124,7 +256,7 @@ class Kitten(Entity):
             Inicializa o gatinho com seus frames de animação e atributos de física.
 
             Args:
-                pos (tuple): Posição inicial (x, y) no cenário.
+                pos (tuple): Posição inicial (x, y) no cenário, usada também para renascer.
         """
         # Define as animações obrigatórias para o Taquinho
         idle = [f'kitten/idle/idle-{i}' for i in [4,5]]
@@ -152,19 +284,71 @@ class Kitten(Entity):
         self.is_moving = False
         self.lives = MAX_LIVES
         self.collected_balls = 0
+        self.spawn_pos = pos
+        self.reset_timer = 0    # Ticks que faltam para renascer depois de um splash
+        self.landed = False
+        self.collected_ball = None
+
+    def get_state(self):
+        """ Captura o estado do Taquinho (ver Entity.get_state). """
+        return super().get_state() + (self.vel_y, self.on_ground, self.is_moving,
+                                      self.lives, self.collected_balls, self.reset_timer)
+
+    def set_state(self, state, i):
+        """ Restaura o estado do Taquinho (ver Entity.set_state). """
+        i = super().set_state(state, i)
+        attrs = self.__dict__
+        attrs['vel_y'] = state[i]
+        attrs['on_ground'] = state[i + 1]
+        attrs['is_moving'] = state[i + 2]
+        attrs['lives'] = state[i + 3]
+        attrs['collected_balls'] = state[i + 4]
+        attrs['reset_timer'] = state[i + 5]
+        return i + 6
+
+    def respawn(self):
+        """
+            Restaura o estado inicial do gatinho após uma colisão.
+
+            Redefine a posição para o ponto de partida, zera a velocidade vertical
+            e remove a flag de morte para permitir que o jogador continue.
+        """
+        # O Taquinho para de se mover verticalmente
+        self.vel_y = 0
 
-    def update(self, platforms, balls):
+        # Fica vivo de novo
+        self.is_dead = False
+
+        # E volta para a posição inicial
+        self.pos = self.spawn_pos
+
+    def update(self, platforms, balls, inputs):
         """
-            Executa a atualização lógica do jogador a cada frame do jogo.
+            Executa a atualização lógica do jogador a cada tick do jogo.
 
             Args:
                 platforms (list): Lista de objetos Platform para verificação de colisão.
                 balls (list): Lista de objetos Ball (itens coletáveis).
+                inputs (int): Combinação dos bits INPUT_LEFT, INPUT_RIGHT e INPUT_JUMP
+                              pressionados neste tick.
         """
 
+        # Conta o tempo até o Taquinho renascer (agendado quando a vovó o acerta)
+        if self.reset_timer > 0:
+            self.reset_timer -= 1
+            if self.reset_timer == 0:
+                self.respawn()
+
+        # Verifica o pulo do Taquinho (o chão considerado é o do tick anterior)
+        if inputs & INPUT_JUMP and self.on_ground:
+            self.vel_y = -15
+            self.frame_index = 0
+
         # Reseta atributos do Taquinho
         self.is_moving = False
         self.on_ground = False
+        self.landed = False         # Caiu em uma plataforma neste tick (levanta poeira)
+        self.collected_ball = None  # Novelo coletado neste tick
 
         # Aplica a gravidade
         self.vel_y += self.gravity
@@ -175,11 +359,11 @@ class Kitten(Entity):
 
         # Se o Taquinho não tiver sendo splashado, garante os movimentos para ambos os lados
         if self.state != "DEATH":
-            if keyboard.d or keyboard.right:
+            if inputs & INPUT_RIGHT:
                 self.x += self.speed
                 vx = self.speed
                 self.is_moving = True
-            elif keyboard.a or keyboard.left:
+            elif inputs & INPUT_LEFT:
                 self.x -= self.speed
                 vx = -self.speed
                 self.is_moving = True
@@ -193,6 +377,7 @@ class Kitten(Entity):
                     # Verifica se o Taquinho estava acima da plataforma no frame anterior
                     # (evita que ele "suba" pela lateral)
                     if (self.y - self.vel_y) <= platform.top:
+                        self.landed = self.vel_y > LANDING_DUST_SPEED
                         self.bottom = platform.top + 3  # Pequeno fine-tuning para garantir
                                                         # que o gatinho não fique flutuando
                         self.vel_y = 0
@@ -203,6 +388,7 @@ class Kitten(Entity):
         for ball in balls:
             if self.colliderect(ball):
                 self.collected_balls += 1
+                self.collected_ball = ball
                 balls.remove(ball)
 
                 # # Ajusta os volumes dos miados
@@ -238,7 +424,7 @@ class Enemy(Entity):
                 distance (int): Raio de patrulha (distância que percorre para cada lado).
         """
         # Define as animações obrigatórias para a vovó
-        idle = [f'enemy/idle/enemy-idle-{i}' for i in [1,4]]
+        idle = [f'enemy/idle/enemy-idle-{i}' for i in [1,3]]
         right_walk = [f'enemy/walk-right/enemy-walk-right-{i}' for i in range(1, 5)]
         left_walk = [f'enemy/walk-left/enemy-walk-left-{i}' for i in range(1, 5)]
 
@@ -259,6 +445,18 @@ class Enemy(Entity):
         self.is_attacking = False
         self.attack_timer = 0.0
 
+    def get_state(self):
+        """ Captura o estado da vovó (ver Entity.get_state). """
+        return super().get_state() + (self.direction, self.attack_timer)
+
+    def set_state(self, state, i):
+        """ Restaura o estado da vovó (ver Entity.set_state). """
+        i = super().set_state(state, i)
+        attrs = self.__dict__
+        attrs['direction'] = state[i]
+        attrs['attack_timer'] = state[i + 1]
+        return i + 2
+
     def update(self):
         """ Atualiza a lógica de comportamento e animação da vovó. """
         if self.is_attacking:
@@ -286,17 +484,41 @@ class Ball(Actor):
         """
         super().__init__(imgs[0], pos)
         self.frames = imgs
+        load_frames(imgs)
         self.frame_index = 0
         self.animation_timer = 0
         self.animation_speed = 10
 
+        # Semente do sorteio de frames, derivada da posição para que dois jogadores
+        # (ou uma re-simulação) sorteiem sempre a mesma sequência
+        self.seed = (int(pos[0]) * 7919 + int(pos[1])) & 0x7fffffff
+
+    def get_state(self):
+        """ Captura o estado do novelo (ver Entity.get_state). """
+        return (self._image_name, self.frame_index, self.animation_timer, self.seed)
+
+    def set_state(self, state, i):
+        """ Restaura o estado do novelo (ver Entity.set_state). """
+        if state[i] != self._image_name:
+            set_frame(self, state[i])
+        attrs = self.__dict__
+        attrs['frame_index'] = state[i + 1]
+        attrs['animation_timer'] = state[i + 2]
+        attrs['seed'] = state[i + 3]
+        return i + 4
+
     def update(self):
         """ Atualiza o estado visual do item. """
         self.animation_timer += 1
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
-            self.frame_index = random.randint(0,3)
-            self.image = self.frames[self.frame_index % len(self.frames)]
+
+            # Gerador congruencial linear: um sorteio determinístico entre 0 e 3
+            self.seed = (self.seed * 1103515245 + 12345) & 0x7fffffff
+            self.frame_index = (self.seed >> 16) % 4
+            frame = self.frames[self.frame_index % len(self.frames)]
+            if frame != self._image_name:
+                set_frame(self, frame)
 
 class Platform(Actor):
     def __init__(self, img, pos):
@@ -0,0 +1,51 @@
+from pgzero.builtins import keyboard, keys
+from settings import *
+
+class KeyboardInput:
+    def __init__(self, controls):
+        """
+            Lê as teclas de um jogador e as converte nos bits INPUT_*.
+
+            Args:
+                controls (dict): Nomes das teclas para 'left', 'right' e 'jump'
+                                 (ex.: KITTEN_CONTROLS).
+        """
+        # Converte os nomes uma única vez, para não procurar as teclas a cada tick
+        self.left_keys = tuple(keys[name.upper()] for name in controls['left'])
+        self.right_keys = tuple(keys[name.upper()] for name in controls['right'])
+        self.jump_keys = tuple(keys[name.upper()] for name in controls['jump'])
+
+        # O pulo vem de on_key_down() e fica guardado até o próximo tick. São dois
+        # contadores, cada um escrito por um só lado (o on_key_down() na thread principal
+        # e o poll() na thread da simulação), para que nenhum pulo se perca entre as threads
+        self.jump_presses = 0
+        self.jumps_read = 0
+
+    def on_key_down(self, key):
+        """
+            Registra o pulo quando uma das teclas de pulo é pressionada.
+
+            Args:
+                key (int): Código da tecla pressionada fornecido pelo Pygame Zero.
+        """
+        if key in self.jump_keys:
+            self.jump_presses += 1
+
+    def poll(self):
+        """
+            Retorna as entradas do jogador para o tick atual.
+
+            Returns:
+                int: Combinação dos bits INPUT_LEFT, INPUT_RIGHT e INPUT_JUMP.
+        """
+        inputs = 0
+        if any(keyboard[key] for key in self.right_keys):
+            inputs |= INPUT_RIGHT
+        if any(keyboard[key] for key in self.left_keys):
+            inputs |= INPUT_LEFT
+        # Vários pulos entre dois ticks valem como um só
+        presses = self.jump_presses
+        if presses != self.jumps_read:
+            inputs |= INPUT_JUMP
+            self.jumps_read = presses
+        return inputs
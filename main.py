@@ -1,8 +1,17 @@
+import time
+from contextlib import nullcontext
 import pgzrun
-from pgzero.music import is_playing
 from pygame import Rect
 from entities import *
 from settings import *
+from text import TextRenderer
+from world import World
+from inputs import KeyboardInput
+from rollback import RollbackSession, UdpPeer, LoopbackRemote
+from simulation import SimulationThread, SnapshotBuffer, take_render_snapshot
+from scenes import Scene, SceneStack
+from particles import ParticleSystem
+from soak import SoakMonitor
 
 # --- Funções auxiliares ---
 def load_assets_imgs(item):
@@ -109,8 +118,8 @@ def load_actors():
         o cenário (plataformas) e os itens coletáveis de uma só vez.
 
         Returns:
-            tuple: Uma tupla contendo (Player, list[Enemy], list[Platform], list[Ball]),
-                   facilitando a atribuição múltipla no início do jogo.
+            tuple: Uma tupla contendo (list[Button], list[Kitten], list[Enemy], list[Platform],
+                   list[Ball]), facilitando a atribuição múltipla no início do jogo.
     """
     try:
         # Cria os botões do menu
@@ -119,8 +128,10 @@ def load_actors():
         btns.append(Button(load_assets_imgs('exit'), EXIT_BTN_MENU))
         btns.append(Button(load_assets_imgs('sound-on'), SOUND_BTN_MENU))
 
-        # Cria o objeto Taquinho, o nosso herói
-        kitten = Kitten(KITTEN_INIT_POS)
+        # Cria o objeto Taquinho, o nosso herói (e o segundo gatinho, no modo de dois jogadores)
+        kittens = [Kitten(KITTEN_INIT_POS)]
+        if TWO_PLAYER_MODE:
+            kittens.append(Kitten(KITTEN2_INIT_POS))
 
         # Cria os objetos vovó, que não pode nem ver o Taquinho
         enemies = [Enemy(GRANDMA1_INIT_POS, GRANDMA1_DISTANCE),
@@ -132,38 +143,58 @@ def load_actors():
         # Cria os novelos a serem coletados pelo Taquinho
         balls = load_balls()
 
-        return btns, kitten, enemies, platforms, balls
+        return btns, kittens, enemies, platforms, balls
 
     except Exception as e:
         print('Um erro surgiu ao tentar instanciar os Actors():', e)
 
-def reset_kitten():
+def load_inputs():
     """
-        Restaura o estado inicial do gatinho após uma colisão.
+        Cria os dispositivos de entrada de cada gatinho e, no modo em rede, a sessão de rollback.
 
-        Redefine a posição para o ponto de partida, zera a velocidade vertical
-        e remove a flag de morte para permitir que o jogador continue.
+        Returns:
+            tuple: Uma tupla contendo (list[KeyboardInput], RollbackSession ou None,
+                   LoopbackRemote ou None).
     """
-    # O Taquinho para de se mover verticalmente
-    kitten.vel_y = 0
-
-    # Fica vivo de novo
-    kitten.is_dead = False
-
-    # E volta para a posição inicial
-    kitten.pos = KITTEN_INIT_POS
+    # Um jogador só: aceita tanto WASD quanto as setas
+    if not TWO_PLAYER_MODE:
+        return [KeyboardInput(KITTEN_CONTROLS)], None, None
+
+    devices = [KeyboardInput(KITTEN1_CONTROLS), KeyboardInput(KITTEN2_CONTROLS)]
+
+    # Dois jogadores no mesmo teclado: sem rede, sem rollback
+    if not NETPLAY_LOOPBACK:
+        return devices, None, None
+
+    # O segundo teclado passa por um socket local, fazendo o papel de um jogador remoto
+    session = RollbackSession(world, UdpPeer(NETPLAY_PORT, (NETPLAY_HOST, NETPLAY_PORT + 1)))
+    remote = LoopbackRemote(devices[1], NETPLAY_PORT + 1, (NETPLAY_HOST, NETPLAY_PORT),
+                            NETPLAY_DELAY_TICKS)
+    return devices, session, remote
+
+def simulate_tick():
+    """ Avança o mundo em um tick, com as entradas atuais de cada gatinho. """
+    if session:
+        # As entradas do segundo gatinho chegam pelo socket, com atraso,
+        # e a sessão corrige as previsões erradas por rollback
+        loopback_remote.pump()
+        session.advance(input_devices[0].poll())
+    else:
+        world.step(tuple(device.poll() for device in input_devices))
 
 def draw_modal(state):
     """
         Renderiza a interface de fim de jogo (Vitória ou Derrota) na tela.
 
         Args:
-            state (str): O estado atual do jogo ("WIN" ou "GAME_OVER").
+            state (str): O tipo de modal ("WIN", "GAME_OVER" ou "PAUSE").
 
         Raises:
-            Exception: Se o game_state não for um dos valores esperados.
+            Exception: Se o tipo de modal não for um dos valores esperados.
     """
     try:
+        instruction = MODAL_INSTRUCTION_TEXT
+
         if state == "WIN":
             title_color = WIN_MODAL_TITLE_GOLD
             edge_color = WIN_MODAL_EDGE
@@ -177,6 +208,15 @@ def draw_modal(state):
 
             title = 'Você perdeu!'
             message = 'O Taquinho ficou muito molhado para continuar...'
+            instruction = GAME_OVER_INSTRUCTION_TEXT
+
+        elif state == "PAUSE":
+            title_color = WIN_MODAL_TITLE_GREEN
+            edge_color = WIN_MODAL_EDGE
+
+            title = 'Pausado'
+            message = 'O Taquinho está tirando uma soneca.'
+            instruction = PAUSE_INSTRUCTION_TEXT
 
         else:
             raise Exception(f'Estado de jogo informado (\'{state}\') não reconhecido na criação do modal.')
@@ -189,268 +229,350 @@ def draw_modal(state):
     screen.draw.filled_rect(modal_rect, MODAL_BACKGROUND_COLOR)
     screen.draw.rect(modal_rect, edge_color)
 
-    # Escrevendo as mensagens
-    screen.draw.text(title, center=MODAL_TITLE_CENTER_POS,
-                     fontsize=MODAL_TITLE_FONT_SIZE, color=title_color,
-                     shadow=MODAL_TITLE_SHADOW, scolor=MODAL_TITLE_SHADOW_COLOR,
-                     fontname=MODAL_FONT)
+    # Escrevendo as mensagens (compostas a partir do atlas de glifos e reaproveitadas entre frames)
+    text_renderer.draw(screen, title, center=MODAL_TITLE_CENTER_POS,
+                       fontsize=MODAL_TITLE_FONT_SIZE, color=title_color,
+                       shadow=MODAL_TITLE_SHADOW, scolor=MODAL_TITLE_SHADOW_COLOR)
 
-    screen.draw.text(message, center=MODAL_MESSAGE_CENTER_POS,
-                     fontsize=MODAL_MESSAGE_FONT_SIZE, color=MODAL_MESSAGE_COLOR,
-                     fontname=MODAL_FONT)
+    text_renderer.draw(screen, message, center=MODAL_MESSAGE_CENTER_POS,
+                       fontsize=MODAL_MESSAGE_FONT_SIZE, color=MODAL_MESSAGE_COLOR)
 
-    screen.draw.text(MODAL_INSTRUCTION_TEXT, center=MODAL_INSTRUCTION_CENTER_POS,
-                     fontsize=MODAL_INSTRUCTION_FONT_SIZE, color=MODAL_INSTRUCTION_COLOR,
-                     fontname=MODAL_FONT)
+    text_renderer.draw(screen, instruction, center=MODAL_INSTRUCTION_CENTER_POS,
+                       fontsize=MODAL_INSTRUCTION_FONT_SIZE, color=MODAL_INSTRUCTION_COLOR)
 
-def on_key_down(key):
+def set_sound(on):
+    """
+        Liga ou desliga a música de fundo.
+
+        Args:
+            on (bool): True para tocar a música, False para pará-la.
     """
-        Processa pressões de teclas únicas para ações de jogo e navegação.
+    global sound_on
+    sound_on = on
 
-        Gerencia o pulo do gatinho durante o jogo e a saída do aplicativo
-        nas telas de vitória ou derrota.
+    if sound_on:
+        sounds.background_ogg.play(-1)
+        sounds.background_ogg.set_volume(0.1)
+    else:
+        sounds.background_ogg.stop()
+
+def restart(checkpoint=False):
+    """
+        Reinicia a partida (ou volta ao último checkpoint) sem recriar nenhum Actor.
 
         Args:
-            key (int): Código da tecla pressionada fornecido pelo Pygame Zero.
+            checkpoint (bool): True para voltar ao último novelo coletado em vez do início.
     """
+    # Com a simulação em outra thread, espera o tick em andamento terminar
+    with simulation.lock if simulation else nullcontext():
+        if checkpoint:
+            world.restore_checkpoint()
+        else:
+            world.restart()
 
-    global game_state
+        # A contagem de ticks voltou: o histórico do rollback não vale mais
+        if session:
+            session.reset()
+            loopback_remote.reset(world.tick)
 
-    # No estado "PLAYING",
-    if game_state == "PLAYING":
-        # Verifica o pulo do Taquinho, quando pressiona o espaço
-        if key == keys.SPACE and kitten.on_ground:
-            kitten.vel_y = -15
-            kitten.frame_index = 0
-            kitten.on_ground = False
+        render_buffer.publish(take_render_snapshot(world))
 
-    # Nos estados "GAME_OVER" ou "WIN",
-    elif game_state == "GAME_OVER" or game_state == "WIN":
-        # Encerra o jogo de pressionado ESC
-        if key == keys.ESCAPE:
-            exit()
+    particles.clear()
 
 def set_playing():
-    """Altera o estado global do jogo para o modo ativo (PLAYING)."""
-    global game_state
-    game_state = "PLAYING"
+    """Começa a partida, trocando o menu pela cena do jogo."""
+    scenes.replace(game_scene)
 
 def set_win():
-    """Altera o estado global do jogo para a tela de vitória (WIN)."""
-    global game_state
-    game_state = "WIN"
+    """Abre o modal de vitória por cima do último frame do jogo."""
+    scenes.push(ModalScene("WIN"))
 
 def set_game_over():
-    """Altera o estado global do jogo para a tela de derrota (GAME_OVER)."""
-    global game_state
-    game_state = "GAME_OVER"
+    """Abre o modal de derrota por cima do último frame do jogo."""
+    scenes.push(ModalScene("GAME_OVER"))
 
-def get_bigger_enemy_hitbox(enemy):
+def get_score_balls(collected_balls):
     """
-        Cria uma área de colisão personalizada e ampliada para uma vovó específica.
+        Renderiza na tela os ícones dos novelos coletados pelos gatinhos.
 
         Args:
-            enemy (Actor): O objeto da vovó para a qual a hitbox será gerada.
-
-        Returns:
-            Rect: Um objeto retangular posicionado ao redor da vovó.
+            collected_balls (int): Quantidade de novelos coletados.
     """
-    enemy_hitbox = Rect(enemy.x-45, enemy.y-50, 90, 100)
-    return enemy_hitbox
+    for i in range(collected_balls):
+        screen.blit(collected_ball_surf, (40 + (i - 1) * 35, 10))
 
-def get_bigger_kitten_hitbox():
+def get_lives_hearts(lives, y):
     """
-        Cria uma área de colisão personalizada e ajustada para o Taquinho (kitten).
+        Renderiza os indicadores de vida (corações) de um gatinho no canto superior direito.
 
-        Returns:
-            Rect: Um objeto retangular que define a zona de impacto do gato.
+        Args:
+            lives (int): Vidas restantes do gatinho.
+            y (int): Altura da linha de corações.
     """
-    kitten_hitbox = Rect(kitten.x - 28, kitten.y - 30, 56, 50)
-    return kitten_hitbox
+    for i in range(lives):
+        screen.blit(life_on_surf, (WIDTH - (i + 1) * 35, y))
 
-def get_score_balls():
-    """ Renderiza na tela os ícones dos novelos coletados pelo gatinho. """
-    for i in range(kitten.collected_balls):
-        screen.blit(load_assets_imgs('collected-ball'), (40 + (i - 1) * 35, 10))
+    for i in range(3 - lives):
+        screen.blit(life_off_surf, (695 + i * 35, y))
 
-def get_lives_hearts():
-    """ Renderiza os indicadores de vida (corações) no canto superior direito. """
-    for i in range(kitten.lives):
-        screen.blit('assets/itens/life-on', (WIDTH - (i + 1) * 35, 10))
-
-    for i in range(3 - kitten.lives):
-        screen.blit('assets/itens/life-off', (695 + i * 35, 10))
+def debug_mode(snapshot):
+    """
+        Desenha os retângulos (pré-filtro) e as máscaras de colisão para ajuste e teste.
 
-def debug_mode():
-    """ Desenha as hitboxes de colisão na tela para fins de ajuste e teste. """
+        Args:
+            snapshot (RenderSnapshot): O snapshot sendo desenhado.
+    """
+    for image, pos in snapshot.sprites:
+        # Os novelos são coletados só pelo retângulo; máscaras, só nos gatinhos e nas vovós
+        screen.draw.rect(Rect(pos, SURFACES[image].get_size()), color=DEBUG_COLOR)
+        if image in mask_collision_frames:
+            screen.blit(get_mask_overlay(image), pos)
 
-    # Carrega o hitbox modificado do Taquinho e desenha na tela
-    kitten_hitbox = get_bigger_kitten_hitbox()
-    screen.draw.rect(kitten_hitbox, color=DEBUG_COLOR)
-    for enemy in enemies:
-        screen.draw.rect(get_bigger_enemy_hitbox(enemy), color=DEBUG_COLOR)
+def draw_game(snapshot):
+    """
+        Desenha um frame do jogo a partir de um snapshot da simulação.
 
-# @TODO: docstrings
-def draw_game():
+        Args:
+            snapshot (RenderSnapshot): Posições, frames e placar de um tick.
+    """
     # Limpa a tela anterior e desenha o fundo
     screen.clear()
-    screen.blit(load_assets_imgs('background'), BACKGROUND_POS)
-
-    # Desenha os hitbox para debugs
-    if DEBUG_MODE:
-        debug_mode()
+    screen.blit(background_surf, BACKGROUND_POS)
 
-    # Desenha as plataformas e chão
+    # Desenha as plataformas e chão (não mudam, então podem vir direto dos Actors)
     for plat in platforms:
         plat.draw()
 
-    # Desenha as vovós
-    for enemy in enemies:
-        enemy.draw()
-
-    # Desenha os novelos
-    for ball in balls:
-        ball.draw()
+    # Desenha as vovós, os novelos e os gatinhos (com as superfícies já carregadas,
+    # sem passar pelo loader de imagens a cada frame)
+    for image, pos in snapshot.sprites:
+        screen.blit(SURFACES[image], pos)
 
-    # Desenha o Taquinho
-    kitten.draw()
+    # Desenha as partículas (respingos, fiapos e poeira) de uma vez
+    particles.draw(screen.surface)
 
     # Desenha o placar (os novelos coletados)
-    get_score_balls()
+    get_score_balls(snapshot.collected_balls)
 
-    # Desenha as vidas restantes
-    get_lives_hearts()
+    # Desenha as vidas restantes (uma linha de corações por gatinho)
+    for n, lives in enumerate(snapshot.lives):
+        get_lives_hearts(lives, 10 + n * 35)
+
+    # Desenha as áreas de colisão por cima dos sprites, para debugs
+    if DEBUG_MODE:
+        debug_mode(snapshot)
 
 
 def draw_menu():
     """Desenha a interface do menu principal."""
     screen.clear()
-    screen.blit(load_assets_imgs('background'), BACKGROUND_POS)
-    screen.blit(load_assets_imgs('title'), TITLE_POS)
+    screen.blit(background_surf, BACKGROUND_POS)
+    screen.blit(title_surf, TITLE_POS)
 
     # Desenha os botões
     for btn in buttons:
         btn.draw()
 
-def on_mouse_down(pos):
-    global game_state, sound_on
-    if game_state == "MENU":
+class MenuScene(Scene):
+    def draw(self, screen):
+        """ Desenha o menu principal. """
+        draw_menu()
+
+    def on_mouse_down(self, pos):
+        """
+            Trata os cliques nos botões de jogar, sair e som.
+
+            Args:
+                pos (tuple): Posição (x, y) do clique.
+        """
         play_btn = buttons[0]
         exit_btn = buttons[1]
         sound_btn = buttons[2]
 
         if play_btn.collidepoint(pos):
-            game_state = "PLAYING"
+            set_playing()
         elif exit_btn.collidepoint(pos):
             exit()
 
         elif sound_btn.collidepoint(pos):
-            if sound_on:
-                sound_on = False
-            else:
-                sound_on = True
+            set_sound(not sound_on)
+
+class GameScene(Scene):
+    def __init__(self):
+        """ Cena da partida; guarda o horário do último frame para animar as partículas. """
+        self.last_frame = None
+
+    def update(self):
+        """
+            Avança a partida e verifica as condições de término.
+
+            Responsabilidades:
+            1. Avançar a simulação (World.step) com as entradas de cada gatinho. No
+               modo em rede, quem avança é a sessão de rollback; no modo com threads,
+               a SimulationThread.
+            2. Monitorar condições de término:
+                - GAME_OVER: Se as vidas de um gatinho chegarem a zero.
+                - WIN: Se todos os novelos (3) forem coletados.
+        """
+        # O snapshot mais novo diz se a partida acabou
+        snapshot = render_buffer.latest()
+
+        # Verifica as vidas dos gatinhos (se perderam)
+        if snapshot.lost:
+            set_game_over()
+
+        # Verifica a quantidade de novelos que os gatinhos coletaram (se ganharam)
+        elif snapshot.won:
+            set_win()
+
+        elif simulation:
+            # A thread da simulação cuida dos ticks; aqui só garantimos que ela está rodando
+            simulation.active.set()
+        else:
+            simulate_tick()
+            render_buffer.publish(take_render_snapshot(world))
+
+    def draw(self, screen):
+        """ Emite e anima as partículas e desenha o snapshot mais novo da simulação. """
+        now = time.perf_counter()
+        dt = min(now - self.last_frame, PARTICLE_MAX_DT) if self.last_frame else 0
+        self.last_frame = now
+
+        # Transforma os efeitos gerados pela simulação em partículas
+        while world.effects:
+            particles.emit(*world.effects.popleft())
+        particles.update(dt)
+
+        draw_game(render_buffer.latest())
+
+    def on_key_down(self, key):
+        """
+            Guarda o pulo dos gatinhos e abre o menu de pausa.
+
+            Args:
+                key (int): Código da tecla pressionada fornecido pelo Pygame Zero.
+        """
+        if key == keys.ESCAPE or key == keys.P:
+            scenes.push(PauseScene())
+            return
+
+        # Guarda o pulo para o próximo tick (o Taquinho só pula se estiver no chão)
+        for device in input_devices:
+            device.on_key_down(key)
+
+    def pause(self):
+        """ Congela a simulação enquanto outra cena está por cima. """
+        if simulation:
+            simulation.active.clear()
+
+class PauseScene(Scene):
+    overlay = True
+
+    def draw(self, screen):
+        """ Desenha o modal de pausa por cima do jogo congelado. """
+        draw_modal("PAUSE")
+
+    def on_key_down(self, key):
+        """ Volta para o jogo com ESC ou P, ou reinicia a partida com R. """
+        if key == keys.R:
+            restart()
+            scenes.pop()
+        elif key == keys.ESCAPE or key == keys.P:
+            scenes.pop()
+
+class ModalScene(Scene):
+    overlay = True
+
+    def __init__(self, state):
+        """
+            Modal de fim de jogo, desenhado por cima do último frame da partida.
+
+            Args:
+                state (str): "WIN" ou "GAME_OVER".
+        """
+        self.state = state
+
+    def draw(self, screen):
+        """ Desenha o modal de vitória ou derrota. """
+        draw_modal(self.state)
+
+    def on_key_down(self, key):
+        """
+            Encerra o jogo com ESC, reinicia com R ou, na derrota, volta ao checkpoint com C.
+
+            Args:
+                key (int): Código da tecla pressionada fornecido pelo Pygame Zero.
+        """
+        if key == keys.ESCAPE:
+            exit()
+        elif key == keys.R:
+            restart()
+            scenes.pop()
+        elif key == keys.C and self.state == "GAME_OVER":
+            restart(checkpoint=True)
+            scenes.pop()
 
 # --- Setup de Objetos ---
-buttons, kitten, enemies, platforms, balls = load_actors()
-
-game_state = "MENU"
-sound_on = True
-is_playing = False
+buttons, kittens, enemies, platforms, balls = load_actors()
+
+# Frames que colidem pela máscara (desenhada no modo debug)
+mask_collision_frames = {frame for actor in kittens + enemies
+                         for frames in actor.animation_map.values() for frame in frames}
+
+# Imagens fixas do fundo e do placar, carregadas uma única vez (e não procuradas a cada frame)
+background_surf = images.load(load_assets_imgs('background'))
+collected_ball_surf = images.load(load_assets_imgs('collected-ball'))
+title_surf = images.load(load_assets_imgs('title'))
+life_on_surf = images.load('assets/itens/life-on')
+life_off_surf = images.load('assets/itens/life-off')
+world = World(kittens, enemies, platforms, balls)
+input_devices, session, loopback_remote = load_inputs()
+render_buffer = SnapshotBuffer(take_render_snapshot(world))
+
+# No modo com threads, os ticks rodam fora do loop do Pygame Zero
+simulation = None
+if THREADED_SIMULATION:
+    simulation = SimulationThread(simulate_tick, world, render_buffer)
+    simulation.start()
+text_renderer = TextRenderer(MODAL_FONT)
+particles = ParticleSystem()
+
+# Monitor opcional de sessões longas (memória, GC e tempo de frame)
+soak = SoakMonitor() if SOAK_MODE else None
+
+# Pilha de cenas: o jogo começa no menu, com a música ligada
+game_scene = GameScene()
+scenes = SceneStack()
+scenes.push(MenuScene())
+set_sound(True)
 
 def update():
-    """
-        Controlador principal do loop lógico do jogo.
-
-        Responsabilidades:
-        1. Atualizar posições e estados do gatinho (kitten), inimigos e itens (balls)
-           apenas quando o estado for "PLAYING".
-        2. Gerenciar o sistema de combate: detecta colisões usando uma hitbox
-           ampliada para os inimigos e aciona o estado de ataque/morte.
-        3. Determinar a direção do impacto (hit_right) para fins de animação do inimigo.
-        4. Monitorar condições de término:
-            - GAME_OVER: Se as vidas do gatinho chegarem a zero.
-            - WIN: Se todos os novelos (3) forem coletados.
-            - EXIT: Finaliza a aplicação.
-    """
-    global game_state
-
-    if not is_playing and sound_on:
-        # music.play('background')
-        sounds.background.play(-1)
-        sounds.background.set_volume(0.1)
-
-    if not sound_on:
-        sounds.background.stop()
-
-
-    # Verifica as vidas do Taquinho (se ele perdeu)
-    if kitten.lives == 0:
-        set_game_over()
-
-    # Verifica a quantidade de novelos que o Taquinho coletou (se ele ganhou)
-    elif kitten.collected_balls == TOT_BALLS:
-        set_win()
-
-    # Controle a serem aplicados apenas no estado "PLAYING"
-    elif game_state == "PLAYING":
-
-        # Chama o controlador do Taquinho
-        kitten.update(platforms, balls)
-
-        # Pega a nova hitbox do gatinho
-        kitten_hitbox = get_bigger_kitten_hitbox()
-
-        # Chama o controlador de cada um dos novelos
-        for ball in balls:
-            ball.update()
+    """ Controlador principal do loop lógico: atualiza só a cena do topo da pilha. """
+    scenes.update()
 
-        # Chama o controlador para cada uma das vovós, e verifica colisões
-        for enemy in enemies:
-            enemy.update()
-
-            # Define uma hitbox maior para as vovós e o Taquinho
-            enemy_hitbox = get_bigger_enemy_hitbox(enemy)
-
-            # Verifica se eles se encontraram (sem o Taquinho já ter sido acertado)
-            if kitten_hitbox.colliderect(enemy_hitbox) and not kitten.is_dead:
-                # Atualiza as variáveis, e garante a animação correta
-                kitten.is_dead = True
-                kitten.lives -= 1
-                kitten.frame_index = 0
-
-                # Verifica o lado que o Taquinho encontra a vovó para que a animação seja correta
-                if kitten.x > enemy.x:
-                    enemy.hit_right = True
-                else:
-                    enemy.hit_right = False
-
-                # Garante o fim da animação após 48 frames
-                enemy.is_attacking = True
-                enemy.attack_timer = 72
-                enemy.frame_index = 0
-
-                # Ajusta o volume dos sons
-                # sounds.angry_cat.set_volume(0.2)
+def draw():
+    """ Responsável por renderizar a cena do topo (e o fundo congelado, se for um overlay). """
+    scenes.draw(screen)
 
-                # Toca os sons
-                # sounds.angry_cat.play()
+    if soak:
+        soak.tick()
 
-                # "Agenda" a execução do "reset" do taquinho após 1s
-                clock.schedule_unique(reset_kitten, 1.2)
+def on_key_down(key):
+    """
+        Processa pressões de teclas únicas, repassando-as para a cena do topo.
 
-def draw():
-    """ Responsável por renderizar todos os elementos visuais na tela a cada frame. """
-    #HERE:global wait_time
+        Args:
+            key (int): Código da tecla pressionada fornecido pelo Pygame Zero.
+    """
+    scenes.on_key_down(key)
 
-    if game_state == "MENU":
-        draw_menu()
+def on_mouse_down(pos):
+    """
+        Processa cliques do mouse, repassando-os para a cena do topo.
 
-    # O que será desenhado na tela quando estivermos no estado "PLAYING"
-    elif game_state == "PLAYING": #HERE: or wait_time < 72:
-        draw_game()
+        Args:
+            pos (tuple): Posição (x, y) do clique.
+    """
+    scenes.on_mouse_down(pos)
 
-    elif game_state == "GAME_OVER" or game_state == "WIN":
-        #HERE:wait_time += 1
-        #HERE:if wait_time >= 72:
-        draw_modal(game_state)
-pgzrun.go()
\ No newline at end of file
+pgzrun.go()
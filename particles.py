@@ -0,0 +1,181 @@
+import math
+import numpy as np
+import pygame
+from settings import *
+
+class ParticleSystem:
+    def __init__(self, capacity=PARTICLE_CAPACITY, kinds=PARTICLE_KINDS):
+        """
+            Sistema de partículas com capacidade fixa, guardado em arrays do NumPy.
+
+            Todos os arrays são alocados aqui; emitir, integrar e desenhar só escrevem
+            neles. No desenho, as partículas vivas são compactadas no começo dos arrays
+            de desenho, e o blits() lê os sprites e as posições direto desses arrays.
+            Quando a capacidade acaba, as partículas mais antigas são reaproveitadas
+            (os slots são usados em ordem circular, a mesma ordem de emissão).
+
+            Args:
+                capacity (int): Quantidade máxima de partículas vivas ao mesmo tempo.
+                kinds (dict): Parâmetros de cada tipo de partícula (ver PARTICLE_KINDS).
+        """
+        self.capacity = capacity
+        self.cursor = 0     # Próximo slot a ser usado (sempre o da partícula mais antiga)
+
+        # Estado das partículas, um valor por slot
+        self.px = np.zeros(capacity, np.float32)
+        self.py = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.gravity = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.float32)       # Segundos restantes (<= 0: morta)
+        self.max_life = np.ones(capacity, np.float32)
+        self.sprite_base = np.zeros(capacity, np.intp)  # Índice do primeiro sprite do tipo
+
+        # Arrays auxiliares, para que as contas não criem arrays temporários
+        self.scratch = np.zeros(capacity, np.float32)
+        self.sprite_index = np.zeros(capacity, np.intp)
+        self.alive = np.zeros(capacity, bool)
+        self.dead = np.zeros(capacity, bool)
+        self.draw_slot = np.zeros(capacity, np.intp)
+        self.rng = np.random.default_rng()
+
+        # Arrays do desenho: as partículas vivas são compactadas no começo de cada um, e
+        # as mortas vão para o slot extra do fim (que nunca é desenhado)
+        self.draw_index = np.zeros(capacity + 1, np.intp)
+        self.draw_x = np.zeros(capacity + 1, np.float32)
+        self.draw_y = np.zeros(capacity + 1, np.float32)
+        self.draw_sprites = np.empty(capacity, dtype=object)
+        self.positions = np.zeros((capacity, 2), np.intp)
+        self.position_rows = list(self.positions)   # Views das linhas, destinos do blits()
+
+        # Parâmetros de cada tipo e os sprites de cada estágio do fade
+        # (sprite do estágio s do tipo k na posição k * PARTICLE_FADE_STAGES + s)
+        self.kind_index = {}
+        self.kind_params = []
+        self.sprites = np.empty(len(kinds) * PARTICLE_FADE_STAGES, dtype=object)
+        for index, (name, (color, size, angles, speeds, lives, gravity)) in enumerate(kinds.items()):
+            self.kind_index[name] = index
+            self.kind_params.append((math.radians(angles[0]), math.radians(angles[1]),
+                                     speeds, lives, gravity))
+            for stage in range(PARTICLE_FADE_STAGES):
+                sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+                sprite.fill(color + (255 * (stage + 1) // PARTICLE_FADE_STAGES,))
+                self.sprites[index * PARTICLE_FADE_STAGES + stage] = sprite
+
+    def _random(self, out, low, high):
+        """ Preenche 'out' com valores uniformes entre low e high, sem alocar. """
+        self.rng.random(dtype=np.float32, out=out)
+        out *= high - low
+        out += low
+
+    def _spawn(self, start, end, kind, x, y):
+        """ Inicializa as partículas dos slots [start, end). """
+        angle_min, angle_max, speeds, lives, gravity = self.kind_params[kind]
+        count = end - start
+        angle = self.scratch[:count]
+
+        self.px[start:end] = x
+        self.py[start:end] = y
+        self.sprite_base[start:end] = kind * PARTICLE_FADE_STAGES
+        self.gravity[start:end] = gravity
+
+        # Direção aleatória dentro do leque do tipo, com velocidade aleatória
+        self._random(angle, angle_min, angle_max)
+        vx = self.vx[start:end]
+        vy = self.vy[start:end]
+        np.cos(angle, out=vx)
+        np.sin(angle, out=vy)
+        self._random(angle, *speeds)
+        vx *= angle
+        vy *= angle
+
+        life = self.life[start:end]
+        self._random(life, *lives)
+        self.max_life[start:end] = life
+
+    def emit(self, name, x, y, count):
+        """
+            Emite uma rajada de partículas a partir de um ponto.
+
+            Args:
+                name (str): Tipo da partícula (chave de PARTICLE_KINDS).
+                x (float): Posição x de origem.
+                y (float): Posição y de origem.
+                count (int): Quantidade de partículas.
+        """
+        kind = self.kind_index[name]
+        count = min(count, self.capacity)
+        start = self.cursor
+        end = start + count
+
+        # Se passar do fim dos arrays, continua do começo (sobrescrevendo as mais antigas)
+        if end <= self.capacity:
+            self._spawn(start, end, kind, x, y)
+        else:
+            self._spawn(start, self.capacity, kind, x, y)
+            self._spawn(0, end - self.capacity, kind, x, y)
+
+        self.cursor = end % self.capacity
+
+    def clear(self):
+        """ Apaga todas as partículas (ex.: ao reiniciar a partida). """
+        self.life.fill(0)
+
+    def update(self, dt):
+        """
+            Integra todas as partículas de uma vez (gravidade, posição e tempo de vida).
+
+            Args:
+                dt (float): Tempo, em segundos, desde a última atualização.
+        """
+        scratch = self.scratch
+        np.multiply(self.gravity, dt, out=scratch)
+        self.vy += scratch
+        np.multiply(self.vx, dt, out=scratch)
+        self.px += scratch
+        np.multiply(self.vy, dt, out=scratch)
+        self.py += scratch
+        self.life -= dt
+
+    def draw(self, surface):
+        """
+            Desenha as partículas vivas com um único Surface.blits(), sem alocar arrays.
+
+            Args:
+                surface (Surface): Superfície de destino (ex.: screen.surface).
+        """
+        # Posição de cada partícula viva nos arrays de desenho (soma acumulada das vivas);
+        # as mortas vão para o slot extra do fim
+        dead = self.dead
+        slot = self.draw_slot
+        np.less_equal(self.life, 0, out=dead)
+        np.logical_not(dead, out=self.alive)
+        np.copyto(slot, self.alive)
+        np.cumsum(slot, out=slot)
+        count = slot[-1]
+        if not count:
+            return
+        slot -= 1
+        np.copyto(slot, self.capacity, where=dead)
+
+        # Quanto menos vida resta, mais transparente o sprite escolhido
+        stage = self.scratch
+        np.divide(self.life, self.max_life, out=stage)
+        stage *= PARTICLE_FADE_STAGES
+        np.minimum(stage, PARTICLE_FADE_STAGES - 1, out=stage)
+        sprite_index = self.sprite_index
+        np.copyto(sprite_index, stage, casting='unsafe')
+        sprite_index += self.sprite_base
+
+        # Compacta os sprites e as posições das partículas vivas
+        np.put(self.draw_index, slot, sprite_index, mode='clip')
+        sprites = self.draw_sprites[:count]
+        np.take(self.sprites, self.draw_index[:count], out=sprites, mode='clip')
+
+        np.put(self.draw_x, slot, self.px, mode='clip')
+        np.put(self.draw_y, slot, self.py, mode='clip')
+        np.copyto(self.positions[:count, 0], self.draw_x[:count], casting='unsafe')
+        np.copyto(self.positions[:count, 1], self.draw_y[:count], casting='unsafe')
+
+        # As linhas de self.positions já são os destinos; o zip para no último sprite vivo
+        surface.blits(zip(sprites, self.position_rows), doreturn=False)
@@ -0,0 +1,282 @@
+import socket
+import struct
+from collections import deque
+from settings import *
+
+# Cabeçalho do pacote de entradas: último tick confirmado do outro jogador (int32, o
+# "ack"), primeiro tick (uint32) e quantidade (uint8), seguidos dos bits INPUT_* (um
+# byte por tick). Cada pacote repete todas as entradas ainda sem ack, então um pacote
+# perdido ou atrasado é coberto pelos seguintes
+INPUT_PACKET = struct.Struct('<iIB')
+INPUT_PACKET_MAX_INPUTS = 255
+
+class UdpPeer:
+    def __init__(self, port, remote_addr):
+        """
+            Troca as entradas de cada tick com o outro jogador por UDP.
+
+            Args:
+                port (int): Porta local onde as entradas do outro jogador chegam.
+                remote_addr (tuple): Endereço (host, porta) do outro jogador.
+        """
+        self.remote_addr = remote_addr
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((NETPLAY_HOST, port))
+        self.sock.setblocking(False)
+
+        self.unacked = deque()  # Entradas locais (tick, bits) que o outro lado ainda não confirmou
+        self.pending = {}       # Entradas remotas que chegaram fora de ordem (tick -> bits)
+        self.ack = -1           # Entradas remotas recebidas, sem buracos, até este tick
+
+    def reset(self, tick):
+        """
+            Recomeça a troca de entradas a partir de um tick (ex.: ao reiniciar a partida).
+
+            Args:
+                tick (int): O próximo tick a ser simulado.
+        """
+        self.unacked.clear()
+        self.pending.clear()
+        self.ack = tick - 1
+
+    def send(self, tick, inputs):
+        """
+            Envia as entradas de um tick (junto com as que ainda não tiveram ack).
+
+            Args:
+                tick (int): O tick a que as entradas pertencem.
+                inputs (int): Bits INPUT_* do jogador local.
+        """
+        self.unacked.append((tick, inputs))
+        self.flush()
+
+    def flush(self):
+        """ Reenvia as entradas sem ack (também chamado durante um stall). """
+        count = min(len(self.unacked), INPUT_PACKET_MAX_INPUTS)
+        if not count:
+            return
+
+        first_tick = self.unacked[0][0]
+        packet = INPUT_PACKET.pack(self.ack, first_tick, count)
+        packet += bytes(self.unacked[i][1] for i in range(count))
+        self.sock.sendto(packet, self.remote_addr)
+
+    def receive(self):
+        """
+            Lê, sem bloquear, todos os pacotes que chegaram desde a última chamada.
+
+            Returns:
+                list: Pares (tick, bits) das entradas remotas que chegaram pela
+                      primeira vez (as repetidas são descartadas).
+        """
+        received = []
+        while True:
+            try:
+                data = self.sock.recv(INPUT_PACKET.size + INPUT_PACKET_MAX_INPUTS)
+            except BlockingIOError:
+                break
+
+            # O outro lado já tem as nossas entradas até remote_ack
+            remote_ack, first_tick, count = INPUT_PACKET.unpack_from(data)
+            while self.unacked and self.unacked[0][0] <= remote_ack:
+                self.unacked.popleft()
+
+            inputs = data[INPUT_PACKET.size:INPUT_PACKET.size + count]
+            for tick, bits in enumerate(inputs, first_tick):
+                if tick > self.ack and tick not in self.pending:
+                    self.pending[tick] = bits
+                    received.append((tick, bits))
+
+        # Avança o ack até o primeiro buraco
+        while self.ack + 1 in self.pending:
+            self.ack += 1
+            del self.pending[self.ack]
+
+        return received
+
+    def close(self):
+        """ Fecha o socket. """
+        self.sock.close()
+
+class LoopbackRemote:
+    def __init__(self, device, port, remote_addr, delay):
+        """
+            Faz o papel do jogador remoto dentro do mesmo processo.
+
+            Lê um dispositivo local (ex.: as setas do teclado) e envia as entradas
+            pelo socket com atraso, para que cheguem "tarde" como viriam da rede.
+
+            Args:
+                device (KeyboardInput): O dispositivo que controla o gatinho remoto.
+                port (int): Porta local do lado remoto.
+                remote_addr (tuple): Endereço (host, porta) da sessão local.
+                delay (int): Atraso, em ticks, antes de cada entrada ser enviada.
+        """
+        self.device = device
+        self.peer = UdpPeer(port, remote_addr)
+        self.delay = delay
+        self.queue = deque()
+        self.tick = 0
+
+    def pump(self):
+        """ Lê as entradas do tick atual e envia as que já cumpriram o atraso. """
+        self.queue.append((self.tick, self.device.poll()))
+        self.tick += 1
+        while len(self.queue) > self.delay:
+            self.peer.send(*self.queue.popleft())
+
+        # Lê os pacotes da sessão local só pelos acks (o lado remoto não simula)
+        self.peer.receive()
+
+    def reset(self, tick):
+        """
+            Recomeça a contagem de ticks (ex.: ao reiniciar a partida).
+
+            Args:
+                tick (int): O tick atual do mundo restaurado.
+        """
+        self.queue.clear()
+        self.peer.reset(tick)
+        self.tick = tick
+
+class RollbackSession:
+    def __init__(self, world, peer, local_player=0, max_rollback=MAX_ROLLBACK_TICKS):
+        """
+            Sincroniza dois jogadores por rollback: prevê as entradas remotas e,
+            quando uma entrada chega atrasada e diferente da prevista, restaura o
+            snapshot daquele tick e simula de novo até o tick atual.
+
+            Se as entradas remotas atrasarem mais que a janela de rollback, o jogo
+            para (stall) até elas chegarem, em vez de seguir com uma previsão que
+            não poderia mais ser corrigida.
+
+            Args:
+                world (World): O mundo simulado (com dois gatinhos).
+                peer (UdpPeer): Conexão com o outro jogador.
+                local_player (int): Índice do gatinho controlado localmente (0 ou 1).
+                max_rollback (int): Quantos ticks, no máximo, podem ser re-simulados.
+        """
+        self.world = world
+        self.peer = peer
+        self.local_player = local_player
+        self.remote_player = 1 - local_player
+        self.max_rollback = max_rollback
+
+        # Buffers circulares indexados por tick % size
+        self.size = max_rollback + 1
+        self.snapshots = [None] * self.size     # Estado do mundo antes de cada tick
+        self.checkpoints = [None] * self.size   # Checkpoint (e se há um pendente) antes de cada tick
+        self.local_inputs = [0] * self.size     # Entradas locais de cada tick
+        self.used_remote = [0] * self.size      # Entrada remota (prevista ou confirmada) usada
+
+        self.remote_inputs = {}     # tick -> entradas remotas confirmadas
+        self.last_remote = 0        # Entrada confirmada mais recente, base da previsão
+        self.last_remote_tick = -1
+        self.held_jump = 0          # Pulo local pressionado durante um stall
+        self.rollbacks = 0
+        self.stalls = 0
+
+    def reset(self):
+        """ Esquece o histórico de entradas e snapshots (ex.: ao reiniciar a partida). """
+        self.snapshots = [None] * self.size
+        self.checkpoints = [None] * self.size
+        self.local_inputs = [0] * self.size
+        self.used_remote = [0] * self.size
+        self.remote_inputs.clear()
+        self.last_remote = 0
+        self.last_remote_tick = -1
+        self.held_jump = 0
+        self.peer.reset(self.world.tick)
+
+    def predict(self, tick):
+        """
+            Retorna a entrada remota de um tick: a confirmada, se já chegou, ou a prevista.
+
+            A previsão repete a última entrada conhecida, sem o pulo (que só vale
+            para o tick em que a tecla foi pressionada).
+
+            Args:
+                tick (int): O tick desejado.
+
+            Returns:
+                int: Bits INPUT_* do jogador remoto.
+        """
+        inputs = self.remote_inputs.get(tick)
+        if inputs is None:
+            inputs = self.last_remote & ~INPUT_JUMP
+        return inputs
+
+    def simulate(self, tick):
+        """
+            Guarda o snapshot e simula um tick com as entradas conhecidas.
+
+            Args:
+                tick (int): O tick a ser simulado (igual a world.tick).
+        """
+        slot = tick % self.size
+        self.snapshots[slot] = self.world.save_state()
+        self.checkpoints[slot] = (self.world.checkpoint, self.world.checkpoint_pending)
+
+        remote = self.used_remote[slot] = self.predict(tick)
+        inputs = [0, 0]
+        inputs[self.local_player] = self.local_inputs[slot]
+        inputs[self.remote_player] = remote
+        self.world.step(inputs)
+
+    def advance(self, local_inputs):
+        """
+            Avança o jogo em um tick, corrigindo o passado se preciso.
+
+            Args:
+                local_inputs (int): Bits INPUT_* do jogador local neste tick.
+
+            Returns:
+                bool: False se o tick não pôde ser simulado (stall), esperando entradas
+                      remotas que já sairiam da janela de rollback.
+        """
+        tick = self.world.tick
+
+        # Recebe as entradas remotas e procura o tick mais antigo em que a previsão errou
+        rollback_tick = None
+        for remote_tick, inputs in self.peer.receive():
+            if remote_tick > self.last_remote_tick:
+                self.last_remote_tick = remote_tick
+                self.last_remote = inputs
+
+            self.remote_inputs[remote_tick] = inputs
+            if remote_tick < tick and self.used_remote[remote_tick % self.size] != inputs:
+                if rollback_tick is None or remote_tick < rollback_tick:
+                    rollback_tick = remote_tick
+
+        # Volta ao tick da previsão errada e simula de novo até o presente
+        if rollback_tick is not None:
+            # O checkpoint volta junto: um novelo coletado só na previsão errada não conta
+            slot = rollback_tick % self.size
+            self.world.load_state(self.snapshots[slot])
+            self.world.checkpoint, self.world.checkpoint_pending = self.checkpoints[slot]
+
+            # Os efeitos desses ticks já foram mostrados na primeira simulação
+            self.world.effects_enabled = False
+            for past_tick in range(rollback_tick, tick):
+                self.simulate(past_tick)
+            self.world.effects_enabled = True
+            self.rollbacks += 1
+
+        # Se a entrada remota mais antiga ainda não recebida sairia da janela de rollback,
+        # o tick espera por ela (guardando o pulo) e as entradas locais são reenviadas
+        local_inputs |= self.held_jump
+        if tick - self.peer.ack > self.max_rollback:
+            self.held_jump = local_inputs & INPUT_JUMP
+            self.stalls += 1
+            self.peer.flush()
+            return False
+        self.held_jump = 0
+
+        # Simula o tick atual
+        self.local_inputs[tick % self.size] = local_inputs
+        self.peer.send(tick, local_inputs)
+        self.simulate(tick)
+
+        # Esquece as entradas que saíram da janela de rollback (todas já recebidas)
+        self.remote_inputs.pop(tick - self.max_rollback, None)
+        return True
@@ -0,0 +1,129 @@
+class Scene:
+    # Cenas sobrepostas (overlay) são desenhadas por cima da cena de baixo, congelada
+    overlay = False
+
+    def update(self):
+        """ Atualiza a lógica da cena (chamado só enquanto ela está no topo da pilha). """
+
+    def draw(self, screen):
+        """
+            Desenha a cena.
+
+            Args:
+                screen (Screen): A tela do Pygame Zero.
+        """
+
+    def on_key_down(self, key):
+        """
+            Trata uma tecla pressionada enquanto a cena está no topo.
+
+            Args:
+                key (int): Código da tecla pressionada fornecido pelo Pygame Zero.
+        """
+
+    def on_mouse_down(self, pos):
+        """
+            Trata um clique enquanto a cena está no topo.
+
+            Args:
+                pos (tuple): Posição (x, y) do clique.
+        """
+
+    def pause(self):
+        """ Chamado quando outra cena é empilhada por cima desta. """
+
+    def resume(self):
+        """ Chamado quando a cena volta a ficar no topo. """
+
+class SceneStack:
+    def __init__(self):
+        """
+            Pilha de cenas: só a cena do topo recebe update e eventos.
+
+            Quando o topo é um overlay, as cenas de baixo são desenhadas uma única vez
+            e guardadas em uma superfície (o fundo congelado), reaproveitada a cada frame.
+        """
+        self.scenes = []
+        self.backdrop = None
+
+    @property
+    def top(self):
+        """ A cena ativa, ou None se a pilha estiver vazia. """
+        return self.scenes[-1] if self.scenes else None
+
+    def push(self, scene):
+        """
+            Empilha uma cena, pausando a que estava no topo.
+
+            Args:
+                scene (Scene): A nova cena ativa.
+        """
+        if self.scenes:
+            self.scenes[-1].pause()
+        self.scenes.append(scene)
+        self.backdrop = None
+
+    def pop(self):
+        """
+            Desempilha a cena do topo e retoma a de baixo.
+
+            Returns:
+                Scene: A cena removida.
+        """
+        scene = self.scenes.pop()
+        self.backdrop = None
+        if self.scenes:
+            self.scenes[-1].resume()
+        return scene
+
+    def replace(self, scene):
+        """
+            Troca a cena do topo por outra.
+
+            Args:
+                scene (Scene): A nova cena ativa.
+        """
+        if self.scenes:
+            self.scenes.pop()
+        self.scenes.append(scene)
+        self.backdrop = None
+
+    def update(self):
+        """ Atualiza só a cena do topo; as de baixo ficam congeladas. """
+        if self.scenes:
+            self.scenes[-1].update()
+
+    def draw(self, screen):
+        """
+            Desenha a cena do topo e, se ela for um overlay, o fundo congelado.
+
+            Args:
+                screen (Screen): A tela do Pygame Zero.
+        """
+        if not self.scenes:
+            return
+
+        top = self.scenes[-1]
+        if top.overlay:
+            if self.backdrop is None:
+                # Desenha, uma única vez, da última cena opaca até logo abaixo do topo
+                base = len(self.scenes) - 1
+                while base > 0 and self.scenes[base].overlay:
+                    base -= 1
+                for scene in self.scenes[base:-1]:
+                    scene.draw(screen)
+                self.backdrop = screen.surface.copy()
+            else:
+                screen.blit(self.backdrop, (0, 0))
+
+        top.draw(screen)
+
+    def on_key_down(self, key):
+        """ Repassa a tecla pressionada para a cena do topo. """
+        if self.scenes:
+            self.scenes[-1].on_key_down(key)
+
+    def on_mouse_down(self, pos):
+        """ Repassa o clique para a cena do topo. """
+        if self.scenes:
+            self.scenes[-1].on_mouse_down(pos)
@@ -11,6 +11,9 @@ SOUND_BTN_MENU = (720, 40)
 MAX_LIVES = 3
 TOT_BALLS = 3
 
+# Tempo (em ticks, a 60 por segundo) até o gatinho renascer depois do splash
+KITTEN_RESET_TICKS = 72
+
 DEBUG_MODE = False
 
 # Cores
@@ -26,9 +29,11 @@ MODAL_MESSAGE_COLOR = (255, 255, 255)
 MODAL_INSTRUCTION_COLOR = (160, 160, 160)
 
 DEBUG_COLOR = (255, 0, 0)
+DEBUG_MASK_COLOR = (255, 0, 0, 110)
 
 # Posições dos Actors
 KITTEN_INIT_POS = (20, 540)
+KITTEN2_INIT_POS = (60, 540)
 GRANDMA1_INIT_POS = (500, 515)
 GRANDMA2_INIT_POS = (550, 222)
 
@@ -68,6 +73,59 @@ MODAL_TITLE_SHADOW_COLOR = (0,0,0)
 MODAL_MESSAGE_CENTER_POS = (WIDTH // 2, HEIGHT // 2 + 20)
 MODAL_MESSAGE_FONT_SIZE = 15
 
-MODAL_INSTRUCTION_TEXT = 'Pressione ESC para sair'
+MODAL_INSTRUCTION_TEXT = 'Pressione R para jogar de novo ou ESC para sair'
+GAME_OVER_INSTRUCTION_TEXT = 'R: reiniciar   C: voltar ao checkpoint   ESC: sair'
+PAUSE_INSTRUCTION_TEXT = 'ESC ou P: continuar   R: reiniciar'
 MODAL_INSTRUCTION_CENTER_POS = (WIDTH // 2, HEIGHT // 2 + 70)
-MODAL_INSTRUCTION_FONT_SIZE = 10
\ No newline at end of file
+MODAL_INSTRUCTION_FONT_SIZE = 10
+
+# Renderização de texto (atlas de glifos)
+TEXT_CACHE_SIZE = 64
+
+# Entradas do gatinho (bits combinados a cada tick)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+
+# Teclas de cada jogador (nomes das teclas do Pygame Zero)
+KITTEN_CONTROLS = {'left': ('a', 'left'), 'right': ('d', 'right'), 'jump': ('space',)}
+KITTEN1_CONTROLS = {'left': ('a',), 'right': ('d',), 'jump': ('space',)}
+KITTEN2_CONTROLS = {'left': ('left',), 'right': ('right',), 'jump': ('up',)}
+
+# Modo de dois jogadores
+TWO_PLAYER_MODE = False
+NETPLAY_LOOPBACK = False    # O segundo gatinho chega por um socket local, simulando um par remoto
+NETPLAY_HOST = '127.0.0.1'
+NETPLAY_PORT = 50007
+NETPLAY_DELAY_TICKS = 4     # Atraso simulado das entradas do par remoto
+MAX_ROLLBACK_TICKS = 8
+
+# Simulação em thread separada do desenho
+THREADED_SIMULATION = False
+SIMULATION_TICK_RATE = 60
+SIMULATION_MAX_LAG = 0.25   # Segundos de atraso a partir dos quais os ticks perdidos são descartados
+
+# Partículas (respingos, fiapos de novelo e poeira)
+PARTICLE_CAPACITY = 4096
+PARTICLE_FADE_STAGES = 4
+PARTICLE_MAX_DT = 0.05      # Maior passo de integração (ex.: ao voltar da pausa)
+PARTICLE_EFFECT_QUEUE = 64  # Efeitos pendentes entre a simulação e o desenho
+LANDING_DUST_SPEED = 3      # Velocidade de queda mínima para levantar poeira
+
+# Tipos de partícula: (cor, tamanho, leque de ângulos em graus, velocidade em px/s,
+#                      vida em segundos, gravidade em px/s²)
+PARTICLE_KINDS = {
+    'splash': ((80, 160, 255), 3, (-160, -20), (80, 260), (0.4, 0.9), 700),
+    'fluff': ((140, 205, 240), 2, (-180, 180), (20, 90), (0.6, 1.2), -30),
+    'dust': ((205, 185, 150), 2, (-180, 0), (20, 70), (0.2, 0.45), 60),
+}
+
+# Monitoramento de sessões longas (memória, GC e tempo de frame)
+SOAK_MODE = False
+SOAK_REPORT_PATH = 'soak-report.log'
+SOAK_REPORT_MAX_BYTES = 1024 * 1024
+SOAK_REPORT_BACKUPS = 5
+SOAK_REPORT_EVERY_FRAMES = 60 * 60 * 5  # Um relatório a cada 5 minutos de jogo (a 60 fps)
+SOAK_TRACE_FRAMES = 600                 # Janela amostrada pelo tracemalloc antes de cada relatório
+SOAK_TRACE_DEPTH = 1                    # Frames da pilha guardados por alocação
+SOAK_TOP_ALLOCATIONS = 10
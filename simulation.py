@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import namedtuple
+from settings import *
+
+# Tudo o que o draw() precisa de um tick, sem referências aos Actors (que seguem mudando)
+RenderSnapshot = namedtuple('RenderSnapshot', ['tick', 'sprites', 'collected_balls', 'lives',
+                                               'lost', 'won'])
+
+def take_render_snapshot(world):
+    """
+        Copia do mundo os dados necessários para desenhar um frame.
+
+        Args:
+            world (World): O mundo simulado.
+
+        Returns:
+            RenderSnapshot: Sprites (nome do frame, canto superior esquerdo) na ordem
+                            de desenho e os valores do placar.
+    """
+    # Ordem de desenho: vovós, novelos e, por cima, os gatinhos
+    sprites = tuple((actor._image_name, (actor._rect.x, actor._rect.y))
+                    for actors in (world.enemies, world.balls, world.kittens)
+                    for actor in actors)
+
+    return RenderSnapshot(world.tick, sprites, world.collected_balls,
+                          tuple(kitten.lives for kitten in world.kittens),
+                          world.is_lost(), world.is_won())
+
+class SnapshotBuffer:
+    def __init__(self, snapshot):
+        """
+            Guarda o último snapshot publicado pela simulação, para o desenho.
+
+            Como os snapshots são imutáveis, basta uma referência: a simulação troca a
+            referência inteira ao publicar (uma atribuição, atômica no Python) e o desenho
+            lê sempre um snapshot completo, sem lock e sem esperar pelo outro lado.
+
+            Args:
+                snapshot (RenderSnapshot): Snapshot inicial, desenhado até o primeiro tick.
+        """
+        self.snapshot = snapshot
+
+    def publish(self, snapshot):
+        """
+            Publica um snapshot completo, substituindo o que ainda não foi desenhado.
+
+            Args:
+                snapshot (RenderSnapshot): O snapshot recém-montado.
+        """
+        self.snapshot = snapshot
+
+    def latest(self):
+        """
+            Retorna o snapshot completo mais novo para ser desenhado.
+
+            Returns:
+                RenderSnapshot: O último snapshot publicado.
+        """
+        return self.snapshot
+
+class SimulationThread(threading.Thread):
+    def __init__(self, step, world, buffer, tick_rate=SIMULATION_TICK_RATE):
+        """
+            Roda os ticks da simulação em uma thread própria, em ritmo fixo.
+
+            Args:
+                step (callable): Função que avança o mundo em um tick (lendo as entradas).
+                world (World): O mundo simulado, de onde saem os snapshots.
+                buffer (SnapshotBuffer): Onde os snapshots são publicados.
+                tick_rate (int): Ticks por segundo.
+        """
+        super().__init__(name='simulation', daemon=True)
+        self.step = step
+        self.world = world
+        self.buffer = buffer
+        self.period = 1 / tick_rate
+
+        # A simulação só anda com 'active' ligado (estado "PLAYING"); o lock fica
+        # preso durante cada tick, para que o mundo possa ser restaurado com segurança
+        self.active = threading.Event()
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def run(self):
+        """ Laço da simulação: um tick a cada período, publicando um snapshot por tick. """
+        next_tick = time.perf_counter()
+        while not self.stopped.is_set():
+            # Pausada: espera sem gastar CPU e não acumula atraso
+            if not self.active.wait(timeout=0.1):
+                next_tick = time.perf_counter()
+                continue
+
+            with self.lock:
+                # Pode ter sido pausada enquanto esperava o lock (ex.: para reiniciar)
+                if not self.active.is_set():
+                    continue
+
+                self.step()
+                snapshot = take_render_snapshot(self.world)
+                self.buffer.publish(snapshot)
+
+            # No fim da partida, a simulação para sozinha
+            if snapshot.lost or snapshot.won:
+                self.active.clear()
+
+            next_tick += self.period
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -SIMULATION_MAX_LAG:
+                # Ficou atrasada demais (ex.: processo suspenso): não tenta recuperar os ticks
+                next_tick = time.perf_counter()
+
+    def stop(self):
+        """ Encerra a thread depois do tick atual. """
+        self.stopped.set()
+        self.active.set()
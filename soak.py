@@ -0,0 +1,312 @@
+import argparse
+import gc
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from logging.handlers import RotatingFileHandler
+import settings
+from settings import *
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+def get_rss():
+    """
+        Retorna a memória residente (RSS) do processo.
+
+        Returns:
+            int or None: RSS atual em bytes (no Linux) ou o pico (em outros sistemas);
+                         None se não houver como medir.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        pass
+
+    if resource is None:
+        return None
+
+    # Sem /proc, só o pico está disponível (em bytes no macOS, em KiB nos demais)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def percentile(ordered, fraction):
+    """
+        Retorna o percentil de uma lista já ordenada (pelo valor mais próximo).
+
+        Args:
+            ordered (list): Valores em ordem crescente (não vazia).
+            fraction (float): O percentil, entre 0 e 1.
+
+        Returns:
+            float: O valor na posição do percentil.
+    """
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+class SoakMonitor:
+    def __init__(self, report_path=None, report_every=None, trace_frames=None, top=None):
+        """
+            Acompanha memória, coleta de lixo e tempo de frame em sessões longas.
+
+            O tracemalloc é ligado só nos 'trace_frames' frames antes de cada relatório:
+            o snapshot tirado no fim da janela contém apenas o que foi alocado nela e
+            continua vivo, ou seja, o que cresce a cada frame. Fora da janela o jogo
+            roda sem o custo do rastreamento.
+
+            Os argumentos omitidos vêm das configurações SOAK_* no momento da criação
+            (e não no import deste módulo).
+
+            Args:
+                report_path (str): Arquivo do relatório (rotacionado pelo tamanho).
+                report_every (int): Frames entre um relatório e o próximo.
+                trace_frames (int): Tamanho, em frames, da janela do tracemalloc.
+                top (int): Quantas linhas de código entram no ranking de alocações.
+        """
+        if report_path is None:
+            report_path = settings.SOAK_REPORT_PATH
+        if report_every is None:
+            report_every = settings.SOAK_REPORT_EVERY_FRAMES
+        if trace_frames is None:
+            trace_frames = settings.SOAK_TRACE_FRAMES
+        if top is None:
+            top = settings.SOAK_TOP_ALLOCATIONS
+
+        self.report_path = report_path
+        self.report_every = report_every
+        self.trace_frames = min(trace_frames, report_every)
+        self.top = top
+
+        self.frame = 0
+        self.last_frame = None
+        self.started = time.perf_counter()
+        self.frame_times = deque(maxlen=report_every)   # Em segundos, desde o último relatório
+
+        # Pausas do GC por geração: [quantidade, tempo total, maior pausa]
+        self.gc_pauses = [[0, 0.0, 0.0] for _ in range(3)]
+        self.gc_started = None
+        gc.callbacks.append(self.on_gc)
+
+        # Logger próprio, que escreve só no arquivo rotativo
+        self.logger = logging.getLogger(f'taquinho.soak.{id(self)}')
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.handler = RotatingFileHandler(report_path, maxBytes=SOAK_REPORT_MAX_BYTES,
+                                           backupCount=SOAK_REPORT_BACKUPS)
+        self.handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        self.logger.addHandler(self.handler)
+
+        # Se a janela é o intervalo inteiro, o primeiro relatório já começa rastreado
+        if self.trace_frames == self.report_every and not tracemalloc.is_tracing():
+            tracemalloc.start(SOAK_TRACE_DEPTH)
+
+    def on_gc(self, phase, info):
+        """
+            Callback do gc.callbacks: mede quanto tempo cada coleta parou o jogo.
+
+            Args:
+                phase (str): "start" ou "stop".
+                info (dict): Dados da coleta (usamos a geração).
+        """
+        if phase == 'start':
+            self.gc_started = time.perf_counter()
+        elif self.gc_started is not None:
+            pause = time.perf_counter() - self.gc_started
+            self.gc_started = None
+            stats = self.gc_pauses[info['generation']]
+            stats[0] += 1
+            stats[1] += pause
+            stats[2] = max(stats[2], pause)
+
+    def tick(self):
+        """ Registra o fim de um frame (chamado uma vez por draw()). """
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.frame_times.append(now - self.last_frame)
+        self.last_frame = now
+        self.frame += 1
+
+        position = self.frame % self.report_every
+        if position == 0:
+            self.report()
+
+        # Abre a janela do tracemalloc 'trace_frames' frames antes do próximo relatório
+        # (se a janela for o intervalo inteiro, ela reabre logo depois deste)
+        if (position + self.trace_frames) % self.report_every == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(SOAK_TRACE_DEPTH)
+
+    def report(self):
+        """ Escreve no arquivo um relatório com RSS, tempos de frame, GC e alocações. """
+        log = self.logger.info
+        elapsed = time.perf_counter() - self.started
+        log('=== frame %d (%.1f min de jogo, %.1f s de relógio) ===',
+            self.frame, self.frame / SIMULATION_TICK_RATE / 60, elapsed)
+
+        rss = get_rss()
+        log('RSS: %s', f'{rss / 1024 ** 2:.1f} MiB' if rss is not None else 'indisponível')
+
+        # Percentis do tempo de frame desde o último relatório
+        if self.frame_times:
+            ordered = sorted(self.frame_times)
+            log('frame (ms): p50=%.2f p95=%.2f p99=%.2f max=%.2f (%d frames)',
+                percentile(ordered, 0.5) * 1000, percentile(ordered, 0.95) * 1000,
+                percentile(ordered, 0.99) * 1000, ordered[-1] * 1000, len(ordered))
+            self.frame_times.clear()
+
+        # Pausas da coleta de lixo desde o último relatório
+        for generation, (count, total, longest) in enumerate(self.gc_pauses):
+            log('GC gen%d: %d coletas, %.2f ms no total, maior pausa %.2f ms',
+                generation, count, total * 1000, longest * 1000)
+        self.gc_pauses = [[0, 0.0, 0.0] for _ in range(3)]
+
+        # O que foi alocado na janela e continua vivo, por linha de código
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            # Ignora o próprio monitor (tempos de frame, snapshot) e o tracemalloc
+            snapshot = snapshot.filter_traces((
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+            ))
+            statistics = snapshot.statistics('lineno')
+            total = sum(stat.size for stat in statistics)
+            log('alocações vivas da janela de %d frames: %.1f KiB', self.trace_frames, total / 1024)
+            for stat in statistics[:self.top]:
+                log('  %s: %.1f KiB em %d blocos', stat.traceback[0], stat.size / 1024, stat.count)
+
+    def close(self):
+        """ Desliga o monitor (callback do GC, tracemalloc e arquivo). """
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+def load_game():
+    """
+        Carrega o main.py sem janela e sem o loop do Pygame Zero.
+
+        Faz os mesmos passos do 'pgzrun main.py' (pgzero.runner), mas com os drivers
+        "dummy" do SDL e sem chamar o loop: quem avança os frames é o run_soak().
+
+        Returns:
+            module: O módulo do jogo, com update(), draw() e os handlers de eventos.
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    from types import ModuleType
+    from pgzero.runner import prepare_mod
+    from pgzero.game import PGZeroGame
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    with open(path, encoding='utf-8') as src:
+        code = compile(src.read(), path, 'exec')
+
+    game = ModuleType('main')
+    game.__file__ = path
+    sys.modules['main'] = game
+
+    # Com _pgzrun ligado, o pgzrun.go() do fim do main.py retorna sem abrir o loop
+    sys._pgzrun = True
+    prepare_mod(game)
+    exec(code, game.__dict__)
+    PGZeroGame(game).reinit_screen()
+    return game
+
+def run_soak(minutes, seed=None, report_path=None, report_every=None):
+    """
+        Joga sozinho, com entradas aleatórias, o mais rápido possível.
+
+        Cada chamada de update()/draw() conta como um frame de 1/60 s de jogo, então
+        horas de jogo passam em minutos. O bot anda, pula, pausa e, ao fim de cada
+        partida, reinicia, exercitando os mesmos caminhos de uma sessão real.
+
+        Args:
+            minutes (float): Minutos de jogo simulados.
+            seed (int): Semente do bot (None para aleatória).
+            report_path (str): Arquivo do relatório (None para SOAK_REPORT_PATH).
+            report_every (int): Frames entre relatórios (None para SOAK_REPORT_EVERY_FRAMES).
+
+        Returns:
+            int: Quantidade de frames executados.
+    """
+    # O main.py lê as configurações no carregamento: a simulação fica no mesmo thread,
+    # para andar na velocidade do bot, e o monitor é criado aqui (não pelo SOAK_MODE)
+    settings.SOAK_MODE = False
+    settings.THREADED_SIMULATION = False
+    game = load_game()
+    game.soak = SoakMonitor(report_path, report_every)
+
+    from pgzero.constants import keys
+    from pgzero.keyboard import keyboard
+
+    rng = random.Random(seed)
+    total_frames = int(minutes * 60 * SIMULATION_TICK_RATE)
+    held = None         # Tecla de movimento segurada pelo bot
+    hold_frames = 0     # Por quantos frames ela ainda fica segurada
+
+    for _ in range(total_frames):
+        scene = game.scenes.top
+        if isinstance(scene, game.MenuScene):
+            game.on_mouse_down(game.buttons[0].center)
+        elif isinstance(scene, game.ModalScene):
+            game.on_key_down(keys.R)
+        elif isinstance(scene, game.PauseScene):
+            if rng.random() < 0.05:
+                game.on_key_down(keys.P)
+        else:
+            # Troca de direção de tempos em tempos (ou fica parado)
+            if hold_frames == 0:
+                if held is not None:
+                    keyboard._release(held)
+                held = rng.choice((keys.LEFT, keys.RIGHT, keys.A, keys.D, None))
+                if held is not None:
+                    keyboard._press(held)
+                hold_frames = rng.randint(10, 120)
+            hold_frames -= 1
+
+            if rng.random() < 0.04:
+                game.on_key_down(rng.choice((keys.SPACE, keys.UP)))
+            elif rng.random() < 0.0005:
+                game.on_key_down(keys.P)
+
+        game.update()
+        game.draw()
+
+    # Relatório final com o que sobrou desde o último (se a sessão não terminou em um)
+    if game.soak.frame % game.soak.report_every:
+        game.soak.report()
+    game.soak.close()
+    return total_frames
+
+def main():
+    """ Linha de comando do teste de longa duração: python soak.py --minutes 240 """
+    parser = argparse.ArgumentParser(description='Teste de longa duração sem janela (soak test).')
+    parser.add_argument('--minutes', type=float, default=240, help='minutos de jogo simulados')
+    parser.add_argument('--seed', type=int, default=None, help='semente das entradas do bot')
+    parser.add_argument('--report', default=None,
+                        help='arquivo do relatório (padrão: SOAK_REPORT_PATH)')
+    parser.add_argument('--report-every', type=int, default=None,
+                        help='frames de jogo entre relatórios (padrão: SOAK_REPORT_EVERY_FRAMES)')
+    args = parser.parse_args()
+
+    # Os padrões vêm das configurações no momento da chamada, como no SoakMonitor
+    report = args.report if args.report is not None else settings.SOAK_REPORT_PATH
+
+    started = time.perf_counter()
+    frames = run_soak(args.minutes, args.seed, report, args.report_every)
+    elapsed = time.perf_counter() - started
+    print(f'{frames} frames ({frames / SIMULATION_TICK_RATE / 3600:.2f} h de jogo) '
+          f'em {elapsed:.1f} s; relatório em {report}')
+
+if __name__ == '__main__':
+    main()
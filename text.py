@@ -0,0 +1,200 @@
+from collections import OrderedDict
+from math import ceil
+import pygame
+from pgzero.loaders import fonts
+from settings import *
+
+# Caracteres rasterizados no atlas: ASCII imprimível + Latin-1 (acentos do português)
+GLYPH_CHARSET = ''.join(chr(c) for c in range(32, 127)) + ''.join(chr(c) for c in range(160, 256))
+
+# Mesma escala de sombra usada pelo screen.draw.text (ptext) do Pygame Zero
+SHADOW_UNIT = 1 / 18
+
+class GlyphAtlas:
+    def __init__(self, fontname, fontsize, color):
+        """
+            Rasteriza todos os glifos da fonte, uma única vez, em uma só superfície.
+
+            Args:
+                fontname (str): Nome da fonte na pasta fonts/ (ex.: 'press-start-2p').
+                fontsize (int): Tamanho da fonte em pixels.
+                color (tuple): Cor (R, G, B) usada para rasterizar os glifos.
+        """
+        font = fonts.load(fontname, fontsize)
+
+        # Renderiza cada caractere separadamente para descobrir o tamanho de cada glifo
+        # (caracteres sem largura na fonte, como o hífen condicional, ficam de fora)
+        chars = [char for char in GLYPH_CHARSET if font.size(char)[0] > 0]
+        glyphs = [font.render(char, True, color) for char in chars]
+
+        # Métricas de cada glifo: quanto ele começa antes da posição da "caneta" (ex.: 'm'
+        # em tamanhos pequenos), quanto a caneta anda depois dele e quanto ele passa da
+        # altura da fonte, acima (ex.: acentos em maiúsculas) e abaixo (ex.: '_')
+        ascent = font.get_ascent()
+        descent = font.get_descent()
+        metrics = {}
+        for char, (minx, _, miny, maxy, advance) in zip(chars, font.metrics(''.join(chars))):
+            metrics[char] = (max(0, -minx), advance, max(0, maxy - ascent), max(0, descent - miny))
+
+        # Todos os glifos ficam alinhados pela mesma linha de base, em células com
+        # espaço para o maior excesso de cada lado
+        self.line_height = font.get_height()
+        self.top = max(top for _, _, top, _ in metrics.values())
+        cell_height = self.top + self.line_height + max(bottom for _, _, _, bottom in metrics.values())
+        self.surface = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), cell_height),
+                                      pygame.SRCALPHA)
+
+        # Cola os glifos lado a lado, guardando o retângulo e as métricas de cada um
+        self.glyphs = {}
+        x = 0
+        for char, glyph in zip(chars, glyphs):
+            self.surface.blit(glyph, (x, self.top - metrics[char][2]))
+            self.glyphs[char] = (pygame.Rect(x, 0, glyph.get_width(), cell_height),) + metrics[char]
+            x += glyph.get_width()
+
+        # Caracteres fora do charset viram '?'
+        self.fallback = self.glyphs['?']
+
+    def layout(self, text):
+        """
+            Posiciona os glifos de um texto do mesmo jeito que o font.render().
+
+            Args:
+                text (str): Texto a ser posicionado.
+
+            Returns:
+                tuple: Os glifos do texto, o x da caneta no início, a largura total e
+                       quanto o texto passa da altura da fonte, acima e abaixo.
+        """
+        glyphs = [self.glyphs.get(char, self.fallback) for char in text]
+        pen = left = right = top = bottom = 0
+        for rect, bearing, advance, over_top, over_bottom in glyphs:
+            # Só o glifo que começa antes do início do texto alarga a superfície para a esquerda
+            left = max(left, bearing - pen)
+            right = max(right, pen - bearing + rect.width)
+            top = max(top, over_top)
+            bottom = max(bottom, over_bottom)
+            pen += advance
+        return glyphs, left, left + max(right, pen), top, bottom
+
+    def measure(self, text):
+        """
+            Calcula o tamanho em pixels de um texto composto com este atlas.
+
+            Args:
+                text (str): Texto a ser medido.
+
+            Returns:
+                tuple: Largura e altura do texto (as mesmas do font.size()).
+        """
+        _, _, width, top, bottom = self.layout(text)
+        return width, top + self.line_height + bottom
+
+    def compose(self, target, text, pos):
+        """
+            Desenha o texto em uma superfície, copiando os glifos do atlas.
+
+            Args:
+                target (Surface): Superfície de destino.
+                text (str): Texto a ser desenhado.
+                pos (tuple): Canto superior esquerdo (x, y) do texto na superfície.
+        """
+        glyphs, pen, _, top, bottom = self.layout(text)
+
+        # Recorta das células só as linhas que o texto ocupa, como faria o font.render()
+        src_y = self.top - top
+        height = top + self.line_height + bottom
+
+        x, y = pos
+        for rect, bearing, advance, _, _ in glyphs:
+            target.blit(self.surface, (x + pen - bearing, y), (rect.x, src_y, rect.width, height))
+            pen += advance
+
+class TextRenderer:
+    def __init__(self, fontname, cache_size=TEXT_CACHE_SIZE):
+        """
+            Inicializa o renderizador de texto baseado em atlas de glifos.
+
+            Args:
+                fontname (str): Nome da fonte na pasta fonts/.
+                cache_size (int): Quantidade máxima de textos prontos mantidos em memória.
+        """
+        self.fontname = fontname
+        self.cache_size = cache_size
+        self.atlases = {}           # (tamanho, cor) -> GlyphAtlas
+        self.cache = OrderedDict()  # (texto, tamanho, cor, sombra, cor da sombra) -> Surface
+
+    def get_atlas(self, fontsize, color):
+        """
+            Retorna o atlas para o tamanho e cor pedidos, criando-o na primeira vez.
+
+            Args:
+                fontsize (int): Tamanho da fonte.
+                color (tuple): Cor (R, G, B) do texto.
+
+            Returns:
+                GlyphAtlas: O atlas com os glifos já rasterizados.
+        """
+        key = (fontsize, color)
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(self.fontname, fontsize, color)
+        return atlas
+
+    def render(self, text, fontsize, color, shadow=None, scolor=(0, 0, 0)):
+        """
+            Compõe o texto em uma superfície, reaproveitando o resultado se nada mudou.
+
+            Args:
+                text (str): Texto a ser renderizado.
+                fontsize (int): Tamanho da fonte.
+                color (tuple): Cor (R, G, B) do texto.
+                shadow (tuple): Deslocamento (x, y) da sombra, na mesma escala do
+                                screen.draw.text. None desativa a sombra.
+                scolor (tuple): Cor (R, G, B) da sombra.
+
+            Returns:
+                Surface: Superfície transparente com o texto desenhado.
+        """
+        key = (text, fontsize, color, shadow, scolor)
+        surface = self.cache.get(key)
+        if surface is not None:
+            # Marca o texto como usado recentemente
+            self.cache.move_to_end(key)
+            return surface
+
+        atlas = self.get_atlas(fontsize, color)
+        width, height = atlas.measure(text)
+
+        if shadow:
+            # Converte o deslocamento da sombra para pixels, como faz o ptext
+            dx, dy = (ceil(s * fontsize * SHADOW_UNIT) for s in shadow)
+            surface = pygame.Surface((width + abs(dx), height + abs(dy)), pygame.SRCALPHA)
+            self.get_atlas(fontsize, scolor).compose(surface, text, (max(dx, 0), max(dy, 0)))
+            atlas.compose(surface, text, (max(-dx, 0), max(-dy, 0)))
+        else:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            atlas.compose(surface, text, (0, 0))
+
+        # Guarda o resultado, descartando o texto usado há mais tempo se o cache encher
+        self.cache[key] = surface
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+        return surface
+
+    def draw(self, screen, text, center, fontsize, color, shadow=None, scolor=(0, 0, 0)):
+        """
+            Desenha o texto na tela, centralizado na posição informada.
+
+            Args:
+                screen (Screen): A tela do Pygame Zero.
+                text (str): Texto a ser desenhado.
+                center (tuple): Posição (x, y) do centro do texto.
+                fontsize (int): Tamanho da fonte.
+                color (tuple): Cor (R, G, B) do texto.
+                shadow (tuple): Deslocamento (x, y) da sombra. None desativa a sombra.
+                scolor (tuple): Cor (R, G, B) da sombra.
+        """
+        surface = self.render(text, fontsize, color, shadow, scolor)
+        screen.blit(surface, surface.get_rect(center=center))
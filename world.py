@@ -0,0 +1,185 @@
+from collections import deque
+from settings import *
+
+class World:
+    def __init__(self, kittens, enemies, platforms, balls):
+        """
+            Agrupa os Actors do nível e a simulação de um tick do jogo.
+
+            Args:
+                kittens (list): Os gatinhos (um por jogador).
+                enemies (list): As vovós.
+                platforms (list): O chão e as plataformas.
+                balls (list): Os novelos ainda não coletados.
+        """
+        self.kittens = kittens
+        self.enemies = enemies
+        self.platforms = platforms
+        self.balls = balls
+
+        # Todos os novelos do nível, inclusive os já coletados (para restaurar snapshots)
+        self.all_balls = tuple(balls)
+
+        # Actors com estado lógico, na ordem em que entram no snapshot
+        self.stateful = tuple(kittens) + tuple(enemies) + self.all_balls
+
+        self.tick = 0
+
+        # Efeitos visuais (tipo, x, y, quantidade) gerados pela simulação e consumidos
+        # pelo desenho; o deque pode ser usado entre threads e descarta os mais antigos
+        self.effects = deque(maxlen=PARTICLE_EFFECT_QUEUE)
+        self.effects_enabled = True
+
+        # Registro do estado inicial (para reiniciar) e do último checkpoint
+        self.initial_state = self.save_state()
+        self.checkpoint = None
+        self.checkpoint_pending = False     # Novelo coletado, esperando o momento de salvar
+
+    @property
+    def collected_balls(self):
+        """ Total de novelos coletados por todos os gatinhos. """
+        return sum(kitten.collected_balls for kitten in self.kittens)
+
+    def is_lost(self):
+        """ Retorna True se algum gatinho ficou sem vidas. """
+        return any(kitten.lives == 0 for kitten in self.kittens)
+
+    def is_won(self):
+        """ Retorna True se todos os novelos foram coletados. """
+        return self.collected_balls == TOT_BALLS
+
+    def add_effect(self, name, x, y, count):
+        """
+            Registra um efeito de partículas para ser emitido pelo desenho.
+
+            Args:
+                name (str): Tipo da partícula (chave de PARTICLE_KINDS).
+                x (float): Posição x de origem.
+                y (float): Posição y de origem.
+                count (int): Quantidade de partículas.
+        """
+        if self.effects_enabled:
+            self.effects.append((name, x, y, count))
+
+    def step(self, inputs):
+        """
+            Avança a simulação em um tick.
+
+            Args:
+                inputs (tuple): As entradas (bits INPUT_*) de cada gatinho, na mesma
+                                ordem de self.kittens.
+        """
+        self.tick += 1
+
+        checkpoint_reached = False
+
+        # Chama o controlador de cada Taquinho
+        for kitten, kitten_inputs in zip(self.kittens, inputs):
+            kitten.update(self.platforms, self.balls, kitten_inputs)
+
+            # Poeira ao cair em uma plataforma e fiapos ao pegar um novelo
+            if kitten.landed:
+                self.add_effect('dust', kitten.x, kitten.bottom, 12)
+            if kitten.collected_ball:
+                self.add_effect('fluff', kitten.collected_ball.x, kitten.collected_ball.y, 60)
+                checkpoint_reached = True
+
+        # Chama o controlador de cada um dos novelos
+        for ball in self.balls:
+            ball.update()
+
+        # Chama o controlador para cada uma das vovós, e verifica colisões
+        for enemy in self.enemies:
+            enemy.update()
+
+            for kitten in self.kittens:
+                # Verifica se eles se encontraram (sem o Taquinho já ter sido acertado),
+                # usando as máscaras dos frames atuais
+                if not kitten.is_dead and kitten.collide_mask(enemy):
+                    # Atualiza as variáveis, e garante a animação correta
+                    kitten.is_dead = True
+                    kitten.lives -= 1
+                    kitten.frame_index = 0
+
+                    # Verifica o lado que o Taquinho encontra a vovó para que a animação seja correta
+                    if kitten.x > enemy.x:
+                        enemy.hit_right = True
+                    else:
+                        enemy.hit_right = False
+
+                    # Garante o fim da animação após 72 ticks
+                    enemy.is_attacking = True
+                    enemy.attack_timer = 72
+                    enemy.frame_index = 0
+
+                    # Respingos da água da vovó
+                    self.add_effect('splash', kitten.x, kitten.y, 120)
+
+                    # Ajusta o volume dos sons
+                    # sounds.angry_cat.set_volume(0.2)
+
+                    # Toca os sons
+                    # sounds.angry_cat.play()
+
+                    # "Agenda" o "reset" do Taquinho (conta em ticks, para caber no snapshot)
+                    kitten.reset_timer = KITTEN_RESET_TICKS
+
+        # Cada novelo coletado vira um checkpoint (salvo com o tick já completo). Se algum
+        # gatinho estiver levando splash, o checkpoint espera ele renascer: assim ele nunca
+        # guarda um gatinho sem vidas (que levaria direto ao GAME_OVER de novo)
+        if checkpoint_reached:
+            self.checkpoint_pending = True
+        if self.checkpoint_pending and not any(kitten.is_dead for kitten in self.kittens):
+            self.checkpoint = self.save_state()
+            self.checkpoint_pending = False
+
+    def restart(self):
+        """
+            Volta o nível inteiro ao estado inicial, reaproveitando os mesmos Actors.
+
+            É o equivalente do Kitten.respawn() para o mundo todo: nada é recriado,
+            só o registro do estado inicial é restaurado.
+        """
+        self.load_state(self.initial_state)
+        self.checkpoint = None
+        self.checkpoint_pending = False
+        self.effects.clear()
+
+    def restore_checkpoint(self):
+        """ Volta ao último checkpoint (ou ao início, se nenhum novelo foi coletado). """
+        self.load_state(self.checkpoint or self.initial_state)
+        self.checkpoint_pending = False
+        self.effects.clear()
+
+    def save_state(self):
+        """
+            Captura todo o estado lógico do mundo em uma única tupla plana.
+
+            Returns:
+                tuple: O tick, os novelos presentes (bits) e o estado de cada Actor.
+        """
+        present = 0
+        for ball in self.balls:
+            present |= 1 << self.all_balls.index(ball)
+
+        state = (self.tick, present)
+        for actor in self.stateful:
+            state += actor.get_state()
+        return state
+
+    def load_state(self, state):
+        """
+            Restaura o mundo a partir de uma tupla gerada por save_state().
+
+            Args:
+                state (tuple): O snapshot a ser restaurado.
+        """
+        self.tick = state[0]
+
+        # Recoloca (ou retira) os novelos, mantendo a própria lista usada pelo jogo
+        present = state[1]
+        self.balls[:] = [ball for n, ball in enumerate(self.all_balls) if present >> n & 1]
+
+        i = 2
+        for actor in self.stateful:
+            i = actor.set_state(state, i)